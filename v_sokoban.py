@@ -4,33 +4,27 @@
 #Usage: python v_sokoban.py <input_board.xsb> <output_directory>
 
 import sys, os, shutil, subprocess, time, re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 def gen_in_bounds(expr_x, expr_y):
     # return SMV condition to check if a cell is within board bounds
     return f"({expr_x} >= 0 & {expr_x} < WIDTH & {expr_y} >= 0 & {expr_y} < HEIGHT)"
 
-def gen_not_wall(expr_x, expr_y, walls):
-    # return SMV condition to ensure a cell is not a wall
+def gen_wall_at(expr_x, expr_y, walls):
+    # return SMV condition that a cell is a wall, as a lookup table with one
+    # row of constant wall columns per board row
     if not walls:
-        return "TRUE"
-    conds = []
-    for (wx, wy) in walls:
-        conds.append(f"!(({expr_x} = {wx}) & ({expr_y} = {wy}))")
-    return "(" + " & ".join(conds) + ")"
-
-def gen_not_box(expr_x, expr_y, num_boxes):
-    # return SMV condition to ensure a cell is not occupied by any box
-    if num_boxes == 0:
-        return "TRUE"
-    conditions = []
-    for i in range(1, num_boxes+1):
-        conditions.append(f"(({expr_x} = box_x[{i}]) & ({expr_y} = box_y[{i}]))")
-    return "!(" + " | ".join(conditions) + ")"
+        return "FALSE"
+    rows = {}
+    for (wx, wy) in sorted(walls):
+        rows.setdefault(wy, []).append(str(wx))
+    arms = [f"{expr_y} = {wy} : {expr_x} in {{{', '.join(xs)}}};" for wy, xs in sorted(rows.items())]
+    return "case " + " ".join(arms) + " TRUE : FALSE; esac"
 
-def gen_free_cell(expr_x, expr_y, walls, num_boxes):
+def gen_free_cell(expr_x, expr_y, wall_cond, box_cond):
     # cell is free if it is in bounds, not a wall, and not occupied by a box
-    return f"({gen_in_bounds(expr_x, expr_y)} & {gen_not_wall(expr_x, expr_y, walls)} & {gen_not_box(expr_x, expr_y, num_boxes)})"
+    return f"({gen_in_bounds(expr_x, expr_y)} & !{wall_cond} & !{box_cond})"
 
 def gen_box_at(expr_x, expr_y, num_boxes):
     # return SMV condition that a box is at a given cell
@@ -38,14 +32,28 @@ def gen_box_at(expr_x, expr_y, num_boxes):
         return "FALSE"
     conditions = []
     for i in range(1, num_boxes+1):
-        conditions.append(f"(({expr_x} = box_x[{i}]) & ({expr_y} = box_y[{i}]))")
+        conditions.append(f"(({expr_x} = box{i}.x) & ({expr_y} = box{i}.y))")
     return "(" + " | ".join(conditions) + ")"
 
 
+def gen_box_adjacent(side, num_boxes):
+    # return SMV condition that some box is right next to the player on a side
+    if num_boxes == 0:
+        return "FALSE"
+    return "(" + " | ".join(f"box{i}.{side}" for i in range(1, num_boxes+1)) + ")"
+
+
+# xsb cell characters, kept as strings so membership tests stay in C
+TARGET_CHARS = ".+*"
+BOX_CHARS    = "$*"
+PLAYER_CHARS = "@+"
+# anything that is not plain floor
+CELL_RE = re.compile(r"[^ ]")
+
 def parse_xsb_board(board_path):
     # returns a dictionary with board layout and entity positions
     with open(board_path, "r") as f:
-        lines = [line.rstrip("\n") for line in f if line.strip() != ""]
+        lines = [line for line in f.read().splitlines() if line.strip() != ""]
     height = len(lines)
     width = max(len(line) for line in lines)
     board = []
@@ -55,21 +63,152 @@ def parse_xsb_board(board_path):
     player = None
     for y, line in enumerate(lines):
         # pad the row to make all rows have the same width
-        row = list(line.ljust(width))
-        board.append(row)
-        for x, ch in enumerate(row):
+        board.append(list(line.ljust(width)))
+        # let the regex engine skip floor cells, only visit the others
+        for m in CELL_RE.finditer(line):
+            x, ch = m.start(), m.group()
             if ch == '#':
                 walls.add((x, y))
-            elif ch in ['.', '+', '*']:
+                continue
+            if ch in TARGET_CHARS:
                 targets.append((x, y))
-            if ch in ['$', '*']:
+            if ch in BOX_CHARS:
                 boxes.append((x, y))
-            if ch in ['@', '+']:
+            elif ch in PLAYER_CHARS:
                 player = (x, y)
     return {"board": board, "width": width, "height": height, "walls": walls,
             "targets": targets, "boxes": boxes, "player": player}
 
 
+def compute_dead_cells(walls, targets, width, height):
+    # returns the non-target cells from which a box can never reach a target
+    def blocked(x, y):
+        return (x, y) in walls or not (0 <= x < width and 0 <= y < height)
+    targets = set(targets)
+
+    # corner rule - a wall (or the board edge) on two perpendicular sides
+    corners = set()
+    for y in range(height):
+        for x in range(width):
+            if blocked(x, y) or (x, y) in targets:
+                continue
+            if (blocked(x - 1, y) or blocked(x + 1, y)) and (blocked(x, y - 1) or blocked(x, y + 1)):
+                corners.add((x, y))
+
+    # wall-hug rule - a target-free run between two corners along one wall
+    dead = set(corners)
+    for (cx, cy) in corners:
+        for dx, dy in [(1, 0), (0, 1)]:
+            run = []
+            side_a = side_b = True
+            x, y = cx + dx, cy + dy
+            while not blocked(x, y) and (x, y) not in targets:
+                if (x, y) in corners:
+                    dead.update(run)
+                    break
+                side_a = side_a and blocked(x - dy, y - dx)
+                side_b = side_b and blocked(x + dy, y + dx)
+                if not (side_a or side_b):
+                    break
+                run.append((x, y))
+                x, y = x + dx, y + dy
+    return dead
+
+
+# cells around the player that moves and pushes look at, by direction and distance
+OFFSETS = {
+    "l": (-1, 0), "r": (1, 0), "u": (0, -1), "d": (0, 1),
+    "l2": (-2, 0), "r2": (2, 0), "u2": (0, -2), "d2": (0, 2),
+}
+# the directly adjacent offsets are also defined inside each Box instance
+BOX_SIDES = {"l": "left", "r": "right", "u": "up", "d": "down"}
+
+def offset_expr(expr, delta):
+    # return SMV expression for a coordinate shifted by a constant
+    if delta == 0:
+        return expr
+    return f"{expr} {'+' if delta > 0 else '-'} {abs(delta)}"
+
+# static parts of the SMV model, filled in once per board or once per box
+SMV_HEADER = """-- Automatically generated SMV model for Sokoban
+MODULE main
+CONSTANTS
+    WIDTH := {width};
+    HEIGHT := {height};
+
+VAR
+    player_x : 0..WIDTH-1;
+    player_y : 0..HEIGHT-1;
+    move : {{l, r, u, d, L, R, U, D}};
+"""
+
+PLAYER_TEMPLATE = """    next(player_x) := case
+        move = l & free_l : player_x - 1;
+        move = r & free_r : player_x + 1;
+        move = u & free_u : player_x;
+        move = d & free_d : player_x;
+        move = L & push_l : player_x - 1;
+        move = R & push_r : player_x + 1;
+        move = U & push_u : player_x;
+        move = D & push_d : player_x;
+        TRUE : player_x;
+    esac;
+
+    next(player_y) := case
+        move = l & free_l : player_y;
+        move = r & free_r : player_y;
+        move = u & free_u : player_y - 1;
+        move = d & free_d : player_y + 1;
+        move = L & push_l : player_y;
+        move = R & push_r : player_y;
+        move = U & push_u : player_y - 1;
+        move = D & push_d : player_y + 1;
+        TRUE : player_y;
+    esac;
+
+"""
+
+# every box is an instance of one module, with x and y updated together
+BOX_MODULE = """
+-- a box moves one cell in the push direction when the player pushes it
+MODULE Box(player_x, player_y, move, free_l2, free_r2, free_u2, free_d2, start_x, start_y)
+VAR
+    x : 0..{max_x};
+    y : 0..{max_y};
+DEFINE
+    left  := x = player_x - 1 & y = player_y;
+    right := x = player_x + 1 & y = player_y;
+    up    := x = player_x & y = player_y - 1;
+    down  := x = player_x & y = player_y + 1;
+ASSIGN
+    init(x) := start_x;
+    init(y) := start_y;
+    next(x) := case
+        move = L & left & free_l2 : x - 1;
+        move = R & right & free_r2 : x + 1;
+        TRUE : x;
+    esac;
+    next(y) := case
+        move = U & up & free_u2 : y - 1;
+        move = D & down & free_d2 : y + 1;
+        TRUE : y;
+    esac;
+"""
+
+# only legal moves can be chosen at all; the case arms keep their own guards
+# so every assigned value stays inside the declared variable ranges
+MOVE_GUARDS = """TRANS
+    (move = l -> free_l) & (move = r -> free_r) & (move = u -> free_u) & (move = d -> free_d) &
+    (move = L -> push_l) & (move = R -> push_r) & (move = U -> push_u) & (move = D -> push_d);
+
+"""
+
+SMV_FOOTER = """-- LTL specification: eventually reach a winning state
+LTLSPEC
+    F win
+"""
+
+
 def generate_smv_model(parsed_board):
     width    = parsed_board["width"]
     height   = parsed_board["height"]
@@ -78,152 +217,108 @@ def generate_smv_model(parsed_board):
     boxes    = parsed_board["boxes"]
     player   = parsed_board["player"]
     num_boxes = len(boxes)
-    targets.sort(key=lambda pos: (pos[1], pos[0]))
-
-    smv_lines = []
-    smv_lines.append("-- Automatically generated SMV model for Sokoban")
-    smv_lines.append("MODULE main")
-    smv_lines.append("CONSTANTS")
-    smv_lines.append(f"    WIDTH := {width};")
-    smv_lines.append(f"    HEIGHT := {height};")
-    smv_lines.append(f"    NUM_BOXES := {num_boxes};")
-    smv_lines.append("")
-    smv_lines.append("VAR")
-    smv_lines.append("    player_x : 0..WIDTH-1;")
-    smv_lines.append("    player_y : 0..HEIGHT-1;")
-    smv_lines.append("    box_x : array 1..NUM_BOXES of 0..WIDTH-1;")
-    smv_lines.append("    box_y : array 1..NUM_BOXES of 0..HEIGHT-1;")
-    smv_lines.append("    move : {l, r, u, d, L, R, U, D};")
-    smv_lines.append("")
-    smv_lines.append("ASSIGN")
-
-    # initialize player's position
-    smv_lines.append(f"    init(player_x) := {player[0]};")
-    smv_lines.append(f"    init(player_y) := {player[1]};")
-
-    # initialize each box's position
-    for i, (bx, by) in enumerate(boxes, start=1):
-        smv_lines.append(f"    init(box_x[{i}]) := {bx};")
-        smv_lines.append(f"    init(box_y[{i}]) := {by};")
-    smv_lines.append("")
-    
-    # calculate conditions for simple moves
-    free_left  = gen_free_cell("player_x - 1", "player_y", walls, num_boxes)
-    free_right = gen_free_cell("player_x + 1", "player_y", walls, num_boxes)
-    free_up    = gen_free_cell("player_x", "player_y - 1", walls, num_boxes)
-    free_down  = gen_free_cell("player_x", "player_y + 1", walls, num_boxes)
-    
-    # calculate conditions for push moves
-    push_left  = f"({gen_box_at('player_x - 1', 'player_y', num_boxes)} & {gen_free_cell('player_x - 2', 'player_y', walls, num_boxes)})"
-    push_right = f"({gen_box_at('player_x + 1', 'player_y', num_boxes)} & {gen_free_cell('player_x + 2', 'player_y', walls, num_boxes)})"
-    push_up    = f"({gen_box_at('player_x', 'player_y - 1', num_boxes)} & {gen_free_cell('player_x', 'player_y - 2', walls, num_boxes)})"
-    push_down  = f"({gen_box_at('player_x', 'player_y + 1', num_boxes)} & {gen_free_cell('player_x', 'player_y + 2', walls, num_boxes)})"
-    
-    # set next state for the x-coordinate of the player based on move
-    smv_lines.append("    next(player_x) := case")
-    smv_lines.append(f"        move = l & {free_left} : player_x - 1;")
-    smv_lines.append(f"        move = r & {free_right} : player_x + 1;")
-    smv_lines.append(f"        move = u & {free_up} : player_x;")
-    smv_lines.append(f"        move = d & {free_down} : player_x;")
-    smv_lines.append(f"        move = L & {push_left} : player_x - 1;")
-    smv_lines.append(f"        move = R & {push_right} : player_x + 1;")
-    smv_lines.append(f"        move = U & {push_up} : player_x;")
-    smv_lines.append(f"        move = D & {push_down} : player_x;")
-    smv_lines.append("        TRUE : player_x;")
-    smv_lines.append("    esac;")
-    smv_lines.append("")
-
-    # set next state for the y-coordinate of the player based on move
-    smv_lines.append("    next(player_y) := case")
-    smv_lines.append(f"        move = l & {free_left} : player_y;")
-    smv_lines.append(f"        move = r & {free_right} : player_y;")
-    smv_lines.append(f"        move = u & {free_up} : player_y - 1;")
-    smv_lines.append(f"        move = d & {free_down} : player_y + 1;")
-    smv_lines.append(f"        move = L & {push_left} : player_y;")
-    smv_lines.append(f"        move = R & {push_right} : player_y;")
-    smv_lines.append(f"        move = U & {push_up} : player_y - 1;")
-    smv_lines.append(f"        move = D & {push_down} : player_y + 1;")
-    smv_lines.append("        TRUE : player_y;")
-    smv_lines.append("    esac;")
-    smv_lines.append("")
-    
-    # set next state for the box after a push move
+
+    # SMV has no parameterized macros, so each cell the player may step or
+    # push into gets its own defines, emitted once and referenced by name
+    offset_cells = {name: (offset_expr("player_x", dx), offset_expr("player_y", dy))
+                    for name, (dx, dy) in OFFSETS.items()}
+    box_at  = {name: gen_box_adjacent(BOX_SIDES[name], num_boxes) if name in BOX_SIDES
+               else gen_box_at(ex, ey, num_boxes) for name, (ex, ey) in offset_cells.items()}
+    wall_at = {name: gen_wall_at(ex, ey, walls) for name, (ex, ey) in offset_cells.items()}
+    free_at = {name: gen_free_cell(ex, ey, f"wall_{name}", f"box_{name}") for name, (ex, ey) in offset_cells.items()}
+    defines = "".join(
+        [f"    box_{name} := {cond};\n" for name, cond in box_at.items()]
+        + [f"    wall_{name} := {cond};\n" for name, cond in wall_at.items()]
+        + [f"    free_{name} := {cond};\n" for name, cond in free_at.items()]
+        # a push needs a box next to the player and a free cell behind it
+        + [f"    push_{name} := box_{name} & free_{name}2;\n" for name in "lrud"]
+    )
+
+    # one Box instance per box, starting at its initial position
+    box_vars = "".join(f"    box{i} : Box(player_x, player_y, move, free_l2, free_r2, free_u2, free_d2, {bx}, {by});\n"
+                       for i, (bx, by) in enumerate(boxes, start=1))
+
+    # initial position of the player
+    inits = f"    init(player_x) := {player[0]};\n    init(player_y) := {player[1]};\n"
+
+    # a box pushed onto a dead cell can never be solved, prune those states
+    dead_cells = sorted(compute_dead_cells(walls, targets, width, height))
+    dead = ""
+    if dead_cells:
+        dead = "".join("INVAR !(" + " | ".join(f"(box{i}.x = {x} & box{i}.y = {y})" for (x, y) in dead_cells) + ");\n"
+                       for i in range(1, num_boxes+1))
+
+    # the winning condition - every box is on some target, whichever one it is
+    on_target = ""
     for i in range(1, num_boxes+1):
-        # update for x-coordinate if pushed horizontally
-        smv_lines.append(f"    next(box_x[{i}]) := case")
-        smv_lines.append(f"        move = L & (box_x[{i}] = player_x - 1 & box_y[{i}] = player_y) & {gen_free_cell('player_x - 2', 'player_y', walls, num_boxes)} : box_x[{i}] - 1;")
-        smv_lines.append(f"        move = R & (box_x[{i}] = player_x + 1 & box_y[{i}] = player_y) & {gen_free_cell('player_x + 2', 'player_y', walls, num_boxes)} : box_x[{i}] + 1;")
-        smv_lines.append(f"        TRUE : box_x[{i}];")
-        smv_lines.append("    esac;")
-
-        # update for y-coordinate if pushed vertically
-        smv_lines.append(f"    next(box_y[{i}]) := case")
-        smv_lines.append(f"        move = U & (box_x[{i}] = player_x & box_y[{i}] = player_y - 1) & {gen_free_cell('player_x', 'player_y - 2', walls, num_boxes)} : box_y[{i}] - 1;")
-        smv_lines.append(f"        move = D & (box_x[{i}] = player_x & box_y[{i}] = player_y + 1) & {gen_free_cell('player_x', 'player_y + 2', walls, num_boxes)} : box_y[{i}] + 1;")
-        smv_lines.append(f"        TRUE : box_y[{i}];")
-        smv_lines.append("    esac;")
-        smv_lines.append("")
-    
-    # the winning condition - each box must be on its corresponding target
-    win_conditions = []
-    for i, (tx, ty) in enumerate(targets[:num_boxes], start=1):
-        win_conditions.append(f"(box_x[{i}] = {tx} & box_y[{i}] = {ty})")
-    smv_lines.append("DEFINE")
-    smv_lines.append("    win := " + " & ".join(win_conditions) + ";")
-    smv_lines.append("")
-    
-    # LTL specification to eventually reach a winning state
-    smv_lines.append("-- LTL specification: eventually reach a winning state")
-    smv_lines.append("LTLSPEC")
-    smv_lines.append("    F win")
-    smv_lines.append("")
-    
-    return "\n".join(smv_lines)
+        cells = " | ".join(f"(box{i}.x = {tx} & box{i}.y = {ty})" for (tx, ty) in targets) or "FALSE"
+        on_target += f"    on_target_{i} := {cells};\n"
+    win = " & ".join(f"on_target_{i}" for i in range(1, num_boxes+1)) or "TRUE"
+
+    # yield the model block by block so the caller can stream it to disk
+    yield SMV_HEADER.format(width=width, height=height)
+    yield box_vars
+    yield "\nDEFINE\n"
+    yield defines
+    yield "\nASSIGN\n"
+    yield inits
+    yield "\n"
+    yield PLAYER_TEMPLATE
+    yield MOVE_GUARDS
+    if dead:
+        yield dead + "\n"
+    yield f"DEFINE\n{on_target}    win := {win};\n\n"
+    yield SMV_FOOTER
+    yield BOX_MODULE.format(max_x=width-1, max_y=height-1)
 
 
-def write_command_file(smv_filename, engine, cmd_filename):
-    commands = []
-    commands.append(f"set engine {engine}")
-    commands.append("go")
-    commands.append('check_ltlspec -p "F win"')
-    commands.append("quit")
-    with open(cmd_filename, "w") as f:
-        f.write("\n".join(commands))
+# model building and checking commands per engine; the SAT run uses
+# incremental bounded model checking instead of BDD-based LTL checking
+ENGINE_COMMANDS = {
+    "bdd": ["go", 'check_ltlspec -p "F win"'],
+    "sat": ["go_bmc", 'check_ltlspec_bmc_inc -p "F win" -k 100'],
+}
 
 def run_nuxmv(smv_file, engine, output_path):
     NUXMV_PATH = "C:\\Users\\Omri Anchi\\Downloads\\nuXmv-2.1.0-win64\\nuXmv-2.1.0-win64\\bin"
-    cmd_filename = os.path.join(os.path.dirname(output_path), f"nuxmv_{engine}.cmd")
-    write_command_file(smv_file, engine, cmd_filename)
-    cmd = [NUXMV_PATH, "-source", cmd_filename, smv_file]
-    start_time = time.time()
-    try:
-        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                              universal_newlines=True, check=True)
-        output = proc.stdout
-    except subprocess.CalledProcessError as e:
-        output = e.stdout
-    runtime = time.time() - start_time
+    # commands go straight to nuXmv's stdin in interactive mode, no command file needed
+    commands = "\n".join([f"set engine {engine}"] + ENGINE_COMMANDS[engine] + ["quit"]) + "\n"
+    cmd = [NUXMV_PATH, "-int", smv_file]
+    start_time = time.perf_counter()
+    solution = None
+    lurds = []
+    tail = ""
+    # stream the output straight to disk and scan it on the way, holding back
+    # only the unfinished last line of each chunk so no match is split
     with open(output_path, "w") as f:
-        f.write(output)
-    return output, runtime
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                universal_newlines=True, bufsize=1 << 16)
+        proc.stdin.write(commands)
+        proc.stdin.close()
+        for chunk in iter(lambda: proc.stdout.read(1 << 16), ""):
+            f.write(chunk)
+            lines, _, tail = (tail + chunk).rpartition("\n")
+            found = scan_output(lines, lurds)
+            solution = solution or found
+        found = scan_output(tail, lurds)
+        solution = solution or found
+        proc.stdout.close()
+        proc.wait()
+    runtime = time.perf_counter() - start_time
+    return solution or "".join(lurds) or None, runtime
 
-import re
+# both patterns stay within one line, since run_nuxmv scans its output in
+# blocks of complete lines
+SOLUTION_RE = re.compile(r"Solution:[ \t]*LURD moves:[ \t]*([lurdLURD]+)")
+# a single pass over the trace picks up every move assignment
+MOVE_RE = re.compile(r"move[ \t]*=[ \t]*([lurdLURD])\b")
 
-def extract_solution(nuxmv_output):
-    match = re.search(r"Solution:\s*LURD moves:\s*([lurdLURD]+)", nuxmv_output)
+def scan_output(text, lurds):
+    # collect the moves in a block of nuXmv output, return an explicit solution if present
+    lurds.extend(MOVE_RE.findall(text))
+    match = SOLUTION_RE.search(text)
     if match:
         return match.group(1)
-
-    lurds = []
-    for line in nuxmv_output.split("\n"):
-        if "move =" in line:
-            move = line.split("=")[-1].strip()
-            if move in "lurdLURD":
-                lurds.append(move)
-
-    if lurds:
-        return "".join(lurds)
-
     return None
 
 
@@ -238,27 +333,44 @@ def main():
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
+    # link the input board into the output directory, copy only if links are unavailable
     board_copy_path = os.path.join(output_dir, os.path.basename(input_board))
-    shutil.copy(input_board, board_copy_path)
+    # never touch a path that resolves to the input board itself
+    if not (os.path.exists(board_copy_path) and os.path.samefile(input_board, board_copy_path)):
+        if os.path.lexists(board_copy_path):
+            os.remove(board_copy_path)
+        try:
+            os.symlink(os.path.abspath(input_board), board_copy_path)
+        except (OSError, NotImplementedError):
+            shutil.copy(input_board, board_copy_path)
     
     parsed_board = parse_xsb_board(input_board)
     
-    smv_model = generate_smv_model(parsed_board)
     smv_filename = os.path.join(output_dir, "board.smv")
-    with open(smv_filename, "w") as f:
-        f.write(smv_model)
+    with open(smv_filename, "w", buffering=1 << 20) as f:
+        f.writelines(generate_smv_model(parsed_board))
     
-    nuxmv_outputs = {}
+    solution = None
+    solution_engine = None
     runtimes = {}
-    for engine in ["bdd", "sat"]:
-        output_path = os.path.join(output_dir, f"nuxmv_{engine}.out")
-        print(f"Running nuXmv with engine {engine}...")
-        output, rt = run_nuxmv(smv_filename, engine, output_path)
-        nuxmv_outputs[engine] = output
-        runtimes[engine] = rt
-        print(f"nuXmv ({engine}) finished in {rt:.2f} seconds. Output saved to {output_path}.")
+    # each engine runs in its own nuXmv process, so the two runs overlap fully
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {}
+        for engine in ["bdd", "sat"]:
+            output_path = os.path.join(output_dir, f"nuxmv_{engine}.out")
+            print(f"Running nuXmv with engine {engine}...")
+            futures[pool.submit(run_nuxmv, smv_filename, engine, output_path)] = (engine, output_path)
+        for future in as_completed(futures):
+            engine, output_path = futures[future]
+            sol, rt = future.result()
+            runtimes[engine] = rt
+            print(f"nuXmv ({engine}) finished in {rt:.2f} seconds. Output saved to {output_path}.")
+            # keep the solution of whichever engine finds one first
+            if solution is None and sol is not None:
+                solution = sol
+                solution_engine = engine
+                print(f"Solution taken from the {engine} engine.")
     
-    solution = extract_solution(nuxmv_outputs["bdd"])
     if solution is None:
         solution_text = "There is no solution."
     else:
@@ -271,7 +383,9 @@ def main():
         f.write(solution_text + "\n")
         f.write(f"BDD engine runtime: {runtimes['bdd']:.2f} seconds\n")
         f.write(f"SAT engine runtime: {runtimes['sat']:.2f} seconds\n")
-        f.write("Runtime improvement: Using nuXmv command files minimized startup overhead.\n")
+        if solution_engine is not None:
+            f.write(f"Solution taken from the {solution_engine} engine\n")
+        f.write("Runtime improvement: Feeding nuXmv its commands over stdin avoids writing command files.\n")
     
     print(f"Solution file saved to {sol_filename}")
 